@@ -3,17 +3,68 @@ Steam Queue Creator - Creates Steam Super Packer queues with configurable Denuvo
 Requires settings.json and language.txt in the same directory.
 """
 
-import requests, re, time, os, json
+import requests, re, time, os, json, asyncio, sqlite3, atexit, threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
+from xml.etree import ElementTree
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+USER_AGENT = "SuperSteamPackerQueueCreator/1.0"
+APPDETAILS_URL = "https://store.steampowered.com/api/appdetails?appids={}"
+CACHE_SCHEMA_VERSION = 1
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+CHUNK_SIZE = 50
+SOFTWARE_LIST_MAX_AGE = 86400
+PROGRESS_INTERVAL = 0.5
+_PLATFORM_MAP = (('windows', 'win64'), ('mac', 'macos'), ('linux', 'lin64'))
+
+# Keeps ASCII code points and drops everything else; misses are memoized as None
+_ASCII_TRANSLATION = defaultdict(lambda: None, {c: c for c in range(128)})
+
+def _strip_nonascii(text):
+    """Remove non-ASCII characters, skipping the copy for pure ASCII text"""
+    return text if text.isascii() else text.translate(_ASCII_TRANSLATION)
+
+def _chunks(ids, size=CHUNK_SIZE):
+    """Split a list of app IDs into fixed-size batches"""
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
 
 class SteamGameProcessor:
     def __init__(self):
         self.settings = self._load_settings()
         self.strings = self._load_languages()
+        self._verbose = self.settings['operation']['verbose_logging']
+        self._rate_limit = self.settings['api']['rate_limit']
+        self._cache_ttl = self.settings['api'].get('cache_ttl', 604800)
+        self._filter_denuvo = self.settings['operation'].get('filter_denuvo', True)
+        self._target_platforms = self.settings['platforms']
+        self._progress_fmt = self.strings['progress']
+        self._denuvo_re = self._compile_denuvo_patterns()
         self.log_path = Path(self.settings['files']['log_file'])
         self.existing_games = self._load_existing_games()
-        self.last_request_time = 0
+        self._next_slot = time.monotonic()
+        self._last_progress = 0.0
+        self._rate_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._cache_lock = threading.Lock()
+        self.session = self._create_session()
+        self.cache = self._open_cache()
         self._setup_logging(self.settings['operation']['enable_logging'])
         self._display_header()
 
@@ -63,49 +114,124 @@ class SteamGameProcessor:
             "error": "Error: {}"
         }
 
+    def _create_session(self):
+        """Create a pooled HTTP session with retries and compression"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(
+            total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES))
+        session.mount('https://', adapter)
+        session.headers.update({'Accept-Encoding': 'gzip', 'User-Agent': USER_AGENT})
+        return session
+
+    def _open_cache(self):
+        """Open the appdetails disk cache, resetting it on schema changes"""
+        cache = sqlite3.connect(self.settings['files'].get('cache_db', 'appdetails.sqlite'), check_same_thread=False)
+        with cache:
+            cache.execute("CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT)")
+            row = cache.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None or int(row[0]) != CACHE_SCHEMA_VERSION:
+                cache.execute("DROP TABLE IF EXISTS appdetails")
+                cache.execute("INSERT OR REPLACE INTO meta(key, value) VALUES ('schema_version', ?)", (str(CACHE_SCHEMA_VERSION),))
+            cache.execute("CREATE TABLE IF NOT EXISTS appdetails(appid INTEGER PRIMARY KEY, fetched_at INTEGER, json BLOB)")
+        atexit.register(cache.close)
+        return cache
+
+    def _get_cached_details(self, app_id):
+        """Return cached appdetails for a game if still fresh"""
+        with self._cache_lock:
+            row = self.cache.execute("SELECT json, fetched_at FROM appdetails WHERE appid = ?", (int(app_id),)).fetchone()
+        if row and time.time() - row[1] < self._cache_ttl:
+            return json_loads(row[0])
+        return None
+
+    def _store_cached_details(self, app_id, details):
+        """Save appdetails for a game to the disk cache"""
+        with self._cache_lock, self.cache:
+            self.cache.execute("INSERT OR REPLACE INTO appdetails(appid, fetched_at, json) VALUES (?, ?, ?)",
+                               (int(app_id), int(time.time()), json.dumps(details)))
+
+    @staticmethod
+    def _decode_app_details(app_id, body):
+        """Extract a game's entry from an appdetails response body"""
+        return json_loads(body).get(str(app_id), {})
+
     def _enforce_rate_limit(self):
-        """Enforce API rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.settings['api']['rate_limit']:
-            sleep_time = self.settings['api']['rate_limit'] - elapsed
-            self.settings['operation']['verbose_logging'] and self._log(f"\nRate limit: waiting {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        """Enforce API rate limiting, safe to call from worker threads"""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._rate_limit
+        if slot > now:
+            if self._verbose:
+                self._log(f"\nRate limit: waiting {slot - now:.2f}s")
+            if self._stop.wait(slot - now):
+                raise InterruptedError("Processing cancelled")
+
+    async def _enforce_rate_limit_async(self, lock):
+        """Space out concurrent API requests"""
+        async with lock:
+            now = time.monotonic()
+            if now < self._next_slot:
+                if self._verbose:
+                    self._log(f"\nRate limit: waiting {self._next_slot - now:.2f}s")
+                await asyncio.sleep(self._next_slot - now)
+            self._next_slot = max(self._next_slot, now) + self._rate_limit
 
     def _setup_logging(self, enable_logging):
         """Initialize logging if enabled"""
-        if enable_logging and (log_dir := os.path.dirname(self.log_path)):
+        self._log_fh = None
+        if not enable_logging:
+            return
+        if log_dir := os.path.dirname(self.log_path):
             os.makedirs(log_dir, exist_ok=True)
-            with open(self.log_path, 'a') as log:
-                log.write(f"\n{'='*50}\nScript started at {datetime.now():%Y-%m-%d %H:%M:%S}\n{'='*50}\n")
+        # Line buffered so the log survives crashes without reopening per message
+        self._log_fh = open(self.log_path, 'a', encoding='utf-8', buffering=1)
+        atexit.register(self._log_fh.close)
+        self._log_fh.write(f"\n{'='*50}\nScript started at {datetime.now():%Y-%m-%d %H:%M:%S}\n{'='*50}\n")
 
     def _log(self, message):
         """Unified logging to console and file"""
-        message.startswith('\r') and print(message, end='', flush=True) or print(message)
-        if self.settings['operation']['enable_logging']:
-            with open(self.log_path, 'a', encoding='utf-8') as log:
-                log.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message.replace('\r', '')}\n")
+        if message.startswith('\r'):
+            # Progress updates are console only
+            print(message, end='', flush=True)
+            return
+        print(message)
+        if self._log_fh:
+            clean = message.replace('\r', '')
+            self._log_fh.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {clean}\n")
+
+    @staticmethod
+    def _load_id_set(path):
+        """Load the app IDs from an 'id #name' list file as integers"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return {int(app_id) for line in f if (app_id := line.partition(' #')[0].strip()).isdigit()}
+        except FileNotFoundError:
+            return set()
 
     def _load_existing_games(self):
         """Load previously processed games"""
         try:
-            games_file = self.settings['files']['games_file']
-            return set(line.split(' #')[0] for line in open(games_file) if line.strip()) if os.path.exists(games_file) else set()
+            return self._load_id_set(self.settings['files']['games_file'])
         except Exception:
             return set()
 
+    def _compile_denuvo_patterns(self):
+        """Combine configured Denuvo strings into one case-insensitive pattern"""
+        patterns = self.settings.get('drm', {}).get('denuvo_strings', ["Denuvo Anti-tamper", "Denuvo Antitamper"])
+        return re.compile('|'.join(map(re.escape, patterns)), re.IGNORECASE) if patterns else None
+
     def _check_denuvo(self, app_data):
         """Check for Denuvo DRM patterns"""
-        if 'drm_notice' not in app_data:
+        notice = app_data.get('drm_notice')
+        if not notice or self._denuvo_re is None:
             return False
-        return any(pattern.lower() in app_data['drm_notice'].lower() 
-                  for pattern in self.settings.get('drm', {}).get('denuvo_strings', 
-                  ["Denuvo Anti-tamper", "Denuvo Antitamper"]))
+        return self._denuvo_re.search(notice) is not None
 
     def _display_header(self):
         """Display configuration status"""
-        denuvo_status = "ENABLED" if self.settings['operation'].get('filter_denuvo', True) else "DISABLED"
-        platforms = self.settings['platforms']
+        denuvo_status = "ENABLED" if self._filter_denuvo else "DISABLED"
+        platforms = self._target_platforms
         print(f"""
 +==============================================================+
 |            {self.strings['header_title']}                   |
@@ -123,130 +249,287 @@ class SteamGameProcessor:
     def get_games(self):
         """Fetch and parse Steam library games"""
         self._enforce_rate_limit()
-        response = requests.get(f"https://steamcommunity.com/id/{self.settings['steam']['steam_id']}/games?tab=all&xml=1")
-        return {id: name.replace('<![CDATA[', '').replace(']]>', '')
-                for id, name in re.findall(r'<game>.*?<appID>(\d+)</appID>.*?<name>(.*?)</name>', 
-                response.text, re.DOTALL)}
+        response = self.session.get(f"https://steamcommunity.com/id/{self.settings['steam']['steam_id']}/games?tab=all&xml=1")
+        games = {}
+        for _, elem in ElementTree.iterparse(BytesIO(response.content)):
+            if elem.tag == 'game':
+                games[int(elem.findtext('appID'))] = elem.findtext('name') or ''
+                elem.clear()
+        return games
 
-    def get_platforms(self, app_id):
-        """Check platforms and DRM status for a game"""
+    async def _fetch_app_body(self, session, app_id, throttle):
+        """Download the raw appdetails response for a game"""
+        for attempt in range(MAX_RETRIES + 1):
+            await throttle()
+            async with session.get(
+                APPDETAILS_URL.format(app_id),
+                timeout=aiohttp.ClientTimeout(total=self.settings['api']['timeout'])
+            ) as resp:
+                if resp.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    resp.raise_for_status()
+                    return await resp.read()
+                retry_after = resp.headers.get('Retry-After', '')
+            # Mirror the requests Retry adapter: honor Retry-After, else back off exponentially
+            delay = int(retry_after) if retry_after.isdigit() else RETRY_BACKOFF * 2 ** attempt
+            if self._verbose:
+                self._log(f"\nHTTP {resp.status} for {app_id}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def _fetch_app_body_sync(self, app_id):
+        """Blocking variant of _fetch_app_body for the thread pool"""
         self._enforce_rate_limit()
+        response = self.session.get(APPDETAILS_URL.format(app_id), timeout=self.settings['api']['timeout'])
+        response.raise_for_status()
+        return response.content
+
+    def _summarize_app_details(self, response, name):
+        """Build the platform summary, queue platforms and name from appdetails"""
+        if not response.get('success'):
+            return 'Unknown', [], name
+
+        app_data = response['data']
+        platforms = app_data.get('platforms', {})
+        is_free = app_data.get('is_free', False)
+        has_denuvo = self._check_denuvo(app_data)
+        
+        if self._verbose:
+            self._log(f"Game: {app_data.get('name')} | Free: {is_free} | Denuvo: {has_denuvo}")
+        
+        available = []
+        queue_platforms = []
+        queueable = not is_free and (not has_denuvo or not self._filter_denuvo)
+        
+        for plat, enabled in _PLATFORM_MAP:
+            if platforms.get(plat) and self._target_platforms[plat]:
+                available.append(plat.capitalize()[:3])
+                if queueable:
+                    queue_platforms.append(enabled)
+        
+        return f"{'/'.join(available) if available else 'Unknown'}{' [DENUVO]' if has_denuvo else ''}", queue_platforms, app_data.get('name', name)
+
+    async def _describe_game(self, app_id, name, fetch):
+        """Summarize a game from cached or freshly fetched appdetails, or None if the lookup failed"""
+        name = name or str(app_id)
         try:
-            response = requests.get(
-                f"https://store.steampowered.com/api/appdetails?appids={app_id}",
-                timeout=self.settings['api']['timeout']
-            ).json().get(str(app_id), {})
-            
-            if response.get('success'):
-                app_data = response['data']
-                platforms = app_data.get('platforms', {})
-                is_free = app_data.get('is_free', False)
-                has_denuvo = self._check_denuvo(app_data)
-                
-                if self.settings['operation']['verbose_logging']:
-                    self._log(f"Game: {app_data.get('name')} | Free: {is_free} | Denuvo: {has_denuvo}")
-                
-                available = []
-                queue_platforms = []
-                
-                for plat, enabled in [('windows', 'win64'), ('mac', 'macos'), ('linux', 'lin64')]:
-                    if platforms.get(plat) and self.settings['platforms'][plat]:
-                        available.append(plat.capitalize()[:3])
-                        if not is_free and (not has_denuvo or not self.settings['operation'].get('filter_denuvo', True)):
-                            queue_platforms.append(enabled)
-                
-                return f"{'/'.join(available) if available else 'Unknown'}{' [DENUVO]' if has_denuvo else ''}", queue_platforms, app_data.get('name', str(app_id))
+            if (details := self._get_cached_details(app_id)) is None:
+                details = self._decode_app_details(app_id, await fetch())
+                self._store_cached_details(app_id, details)
+            return self._summarize_app_details(details, name)
         except Exception as e:
-            self.settings['operation']['verbose_logging'] and self._log(f"Error checking platforms for {app_id}: {e}")
-        return 'Unknown', [], str(app_id)
+            if self._verbose:
+                self._log(f"Error checking platforms for {app_id}: {e}")
+        return None
+
+    async def get_platforms(self, session, app_id, throttle, name=None):
+        """Check platforms and DRM status for a game, or None if the lookup failed"""
+        return await self._describe_game(app_id, name, lambda: self._fetch_app_body(session, app_id, throttle))
+
+    def get_platforms_sync(self, app_id, name=None):
+        """Check platforms and DRM status for a game from a worker thread, or None if the lookup failed"""
+        async def fetch():
+            return self._fetch_app_body_sync(app_id)
+        # Each worker drives the shared coroutine on its own short-lived event loop
+        return asyncio.run(self._describe_game(app_id, name, fetch))
 
     def get_software(self):
         """Update and return software list"""
-        existing_ids = set()
         software_file = self.settings['files']['software_file']
-        
-        if os.path.exists(software_file):
-            with open(software_file, 'r', encoding='utf-8') as f:
-                existing_ids = {line.split(' #')[0] for line in f if line.strip()}
+        existing_ids = self._load_id_set(software_file)
+        # The app list changes slowly, so reuse it for a day before refetching
+        if existing_ids and os.path.getmtime(software_file) > time.time() - SOFTWARE_LIST_MAX_AGE:
+            return existing_ids
 
         self._enforce_rate_limit()
-        response = requests.get(
-            f"https://api.steampowered.com/IStoreService/GetAppList/v1/",
-            params={
-                'key': self.settings['steam']['api_key'],
-                'format': 'xml',
-                'include_games': 'false',
-                'include_dlc': 'true',
-                'include_software': 'true',
-                'include_videos': 'false',
-                'include_hardware': 'false',
-                'max_results': '500000'
-            }
-        )
-
-        new_entries = re.findall(r'<appid>(\d+)</appid>.*?<name>(.*?)</name>', response.text, re.DOTALL)
-        
+        try:
+            response = self.session.get(
+                f"https://api.steampowered.com/IStoreService/GetAppList/v1/",
+                params={
+                    'key': self.settings['steam']['api_key'],
+                    'format': 'json',
+                    'include_games': 'false',
+                    'include_dlc': 'true',
+                    'include_software': 'true',
+                    'include_videos': 'false',
+                    'include_hardware': 'false',
+                    'max_results': '500000'
+                }
+            )
+            response.raise_for_status()
+            apps = json_loads(response.content).get('response', {}).get('apps', [])
+        except (requests.RequestException, ValueError) as e:
+            # Keep going with the last known list rather than aborting the run
+            self._log(self.strings['error'].format(f"Could not fetch software list: {e}"))
+            return existing_ids
+
         with open(software_file, 'a', encoding='utf-8') as f:
-            for app_id, name in new_entries:
+            for app in apps:
+                app_id = int(app['appid'])
                 if app_id not in existing_ids:
-                    f.write(f"{app_id} #{name.encode('ascii', 'ignore').decode('ascii')}\n")
+                    f.write(f"{app_id} #{_strip_nonascii(app.get('name', ''))}\n")
                     existing_ids.add(app_id)
+        os.utime(software_file)
 
         return existing_ids
 
-    def _process_games_list(self, game_ids):
+    def _process_games_list(self, game_ids, names=None):
         """Process games and generate queue"""
-        queue_data, games_list, denuvo_count = [], [], 0
+        concurrency = self.settings['api'].get('concurrency', 4)
         total_games = min(len(game_ids), self.settings['operation']['test_limit']) if self.settings['operation']['test_mode'] else len(game_ids)
-        processed_count = 0
         
         self._log("\n" + self.strings['processing_ready'].format(total_games))
-        self._log(self.strings['estimated_time'].format(time.strftime('%H:%M:%S', time.gmtime(total_games * self.settings['api']['rate_limit']))))
+        self._log(self.strings['estimated_time'].format(time.strftime('%H:%M:%S', time.gmtime(total_games * self._rate_limit))))
         input("\n" + self.strings['press_enter'] + "\n")
 
-        start_time = time.time()
-        
-        for game_id in game_ids:
-            if self.settings['operation']['test_mode'] and processed_count >= self.settings['operation']['test_limit']:
-                self._log("\n" + self.strings['test_mode_limit'].format(self.settings['operation']['test_limit']))
-                break
-
-            # Show progress
-            if processed_count > 0:
-                elapsed = time.time() - start_time
-                remaining = (total_games - processed_count) * (elapsed / processed_count)
-                self._log("\r" + self.strings['progress'].format(
-                    (processed_count / total_games) * 100,
-                    time.strftime('%H:%M:%S', time.gmtime(remaining)),
-                    processed_count, total_games, denuvo_count
-                ))
-
-            platforms_str, queue_platforms, game_name = self.get_platforms(game_id)
-            denuvo_count += '[DENUVO]' in platforms_str
-            games_list.append(f"{game_id} #{game_name.encode('ascii', 'ignore').decode('ascii')} [{platforms_str}]")
-            queue_data.extend(f"{platform}|{game_id}|Public|" for platform in queue_platforms)
-            processed_count += 1
-
-        # Save results
-        if games_list:
-            games_file = self.settings['files']['games_file']
-            mode = 'a' if os.path.exists(games_file) and not self.settings['operation']['queue_from_file'] else 'w'
-            with open(games_file, mode, encoding='utf-8') as f:
-                if mode == 'a' and os.path.getsize(games_file) > 0:
-                    f.write('\n')
-                f.write('\n'.join(games_list))
-            self._log(f"\nAdded {len(games_list)} games to {games_file}")
-
-        if queue_data:
-            with open(self.settings['files']['queue_file'], 'w', encoding='utf-8') as f:
-                f.write('\n'.join(queue_data))
-            self._log("\n" + self.strings['created_queue'].format(len(queue_data)))
-            denuvo_count and self._log(self.strings['skipped_denuvo'].format(denuvo_count))
+        games_file = self.settings['files']['games_file']
+        try:
+            games_size = os.stat(games_file).st_size
+        except FileNotFoundError:
+            games_size = None
+        mode = 'a' if games_size is not None and not self.settings['operation']['queue_from_file'] else 'w'
+        needs_newline = mode == 'a' and games_size > 0 and self._missing_trailing_newline(games_file)
+
+        # Results are written as they arrive so an interrupted run keeps its progress,
+        # and existing files are only replaced once there is something to put in them
+        write_games, close_games = self._lazy_writer(games_file, mode, '\n' if needs_newline else '')
+        write_queue, close_queue = self._lazy_writer(self.settings['files']['queue_file'], 'w')
+        try:
+            args = (game_ids[:total_games], names or {}, concurrency, write_games, write_queue)
+            if aiohttp:
+                games_count, queue_count, denuvo_count, failed_count = asyncio.run(self._process_games_list_async(*args))
+            else:
+                games_count, queue_count, denuvo_count, failed_count = self._process_games_list_threaded(*args)
+        finally:
+            close_games()
+            close_queue()
+        if total_games < len(game_ids):
+            self._log("\n" + self.strings['test_mode_limit'].format(self.settings['operation']['test_limit']))
+
+        if games_count:
+            self._log(f"\nAdded {games_count} games to {games_file}")
+        if failed_count:
+            self._log(f"\nCould not fetch details for {failed_count} games; they will be retried next run")
+        if queue_count:
+            self._log("\n" + self.strings['created_queue'].format(queue_count))
+            if denuvo_count:
+                self._log(self.strings['skipped_denuvo'].format(denuvo_count))
         else:
             self._log("\n" + self.strings['no_games'])
 
         return True
 
+    @staticmethod
+    def _lazy_writer(path, mode, prefix=''):
+        """Return write/close callables that only open path on the first write"""
+        fh = None
+
+        def write(text):
+            nonlocal fh
+            if fh is None:
+                fh = open(path, mode, encoding='utf-8')
+                text = prefix + text
+            fh.write(text)
+            fh.flush()
+
+        def close():
+            if fh is not None:
+                fh.close()
+
+        return write, close
+
+    @staticmethod
+    def _missing_trailing_newline(path):
+        """Check whether a file ends without a newline"""
+        try:
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b'\n'
+        except OSError:
+            return False
+
+    def _record_result(self, game_id, result, write_games, write_queue):
+        """Write a processed game to the output files"""
+        platforms_str, queue_platforms, game_name = result
+        write_games(f"{game_id} #{_strip_nonascii(game_name)} [{platforms_str}]\n")
+        if queue_platforms:
+            write_queue(''.join([f"{platform}|{game_id}|Public|\n" for platform in queue_platforms]))
+        return len(queue_platforms), '[DENUVO]' in platforms_str
+
+    def _show_progress(self, processed_count, total_games, denuvo_count, start_time):
+        """Display progress and estimated time remaining, at most every PROGRESS_INTERVAL"""
+        now = time.monotonic()
+        if processed_count < total_games and now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        elapsed = now - start_time
+        remaining = (total_games - processed_count) * (elapsed / processed_count)
+        self._log("\r" + self._progress_fmt.format(
+            (processed_count / total_games) * 100,
+            time.strftime('%H:%M:%S', time.gmtime(remaining)),
+            processed_count, total_games, denuvo_count
+        ))
+
+    async def _process_games_list_async(self, game_ids, names, concurrency, write_games, write_queue):
+        """Fetch game details concurrently while honoring the rate limit"""
+        games_count, queue_count, denuvo_count, failed_count = 0, 0, 0, 0
+        total_games = len(game_ids)
+        semaphore, rate_lock = asyncio.Semaphore(concurrency), asyncio.Lock()
+        start_time = time.monotonic()
+        record, show_progress, get_platforms = self._record_result, self._show_progress, self.get_platforms
+
+        async with aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, limit_per_host=8),
+                headers={'User-Agent': USER_AGENT}) as session:
+            async def throttle():
+                await self._enforce_rate_limit_async(rate_lock)
+
+            async def bounded(game_id):
+                async with semaphore:
+                    return game_id, await get_platforms(session, game_id, throttle, names.get(game_id))
+
+            for chunk in _chunks(game_ids):
+                for task in asyncio.as_completed([bounded(gid) for gid in chunk]):
+                    game_id, result = await task
+                    # Failed lookups stay out of games.txt so the next run retries them
+                    if result is None:
+                        failed_count += 1
+                    else:
+                        queued, has_denuvo = record(game_id, result, write_games, write_queue)
+                        games_count += 1
+                        queue_count += queued
+                        denuvo_count += has_denuvo
+                    show_progress(games_count + failed_count, total_games, denuvo_count, start_time)
+
+        return games_count, queue_count, denuvo_count, failed_count
+
+    def _process_games_list_threaded(self, game_ids, names, concurrency, write_games, write_queue):
+        """Fetch game details on a thread pool when aiohttp is not installed"""
+        games_count, queue_count, denuvo_count, failed_count = 0, 0, 0, 0
+        total_games = len(game_ids)
+        start_time = time.monotonic()
+        record, show_progress, get_platforms = self._record_result, self._show_progress, self.get_platforms_sync
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            for chunk in _chunks(game_ids):
+                futures = {executor.submit(get_platforms, gid, names.get(gid)): gid for gid in chunk}
+                for future in as_completed(futures):
+                    if (result := future.result()) is None:
+                        failed_count += 1
+                    else:
+                        queued, has_denuvo = record(futures[future], result, write_games, write_queue)
+                        games_count += 1
+                        queue_count += queued
+                        denuvo_count += has_denuvo
+                    show_progress(games_count + failed_count, total_games, denuvo_count, start_time)
+        except BaseException:
+            # On Ctrl-C or any error, drop queued lookups and wake workers waiting on the rate limiter
+            self._stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        return games_count, queue_count, denuvo_count, failed_count
+
     def process_queue_from_file(self):
         """Process games from input file"""
         try:
@@ -256,7 +539,7 @@ class SteamGameProcessor:
 
             self._log(self.strings['fetching_games'])
             with open(input_file, 'r', encoding='utf-8') as f:
-                game_ids = [line.split('#')[0].strip() for line in f if line.strip()]
+                game_ids = [int(app_id) for line in f if (app_id := line.partition('#')[0].strip()).isdigit()]
 
             return self._process_games_list(game_ids) if game_ids else self._log(self.strings['no_games'])
         except Exception as e:
@@ -278,7 +561,7 @@ class SteamGameProcessor:
             return self._process_games_list([
                 game_id for game_id in games.keys()
                 if game_id not in software_ids and game_id not in self.existing_games
-            ])
+            ], games)
         except Exception as e:
             self._log(self.strings['error'].format(str(e)))
             return False